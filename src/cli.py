@@ -2,8 +2,10 @@
 
 import argparse
 import json
+import multiprocessing
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 # Allow running as `python3 src/cli.py` from the repo root
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -11,8 +13,8 @@ REPO_DIR = os.path.dirname(SCRIPT_DIR)
 if REPO_DIR not in sys.path:
     sys.path.insert(0, REPO_DIR)
 
-from src.feed import load_feeds, parse_feed, fetch_transcript
-from src.transcribe import download_audio, transcribe_audio
+from src.feed import load_feeds, parse_feed, fetch_transcripts
+from src.transcribe import download_audio, episode_cache_path, transcribe_audio_counted
 from src import db
 from src.export import export_transcripts, export_transcripts_json
 
@@ -21,6 +23,117 @@ DEFAULT_DB = os.path.join(REPO_DIR, "data", "podcasts.db")
 DEFAULT_FEEDS = os.path.join(REPO_DIR, "feeds.json")
 DEFAULT_CACHE = os.path.join(REPO_DIR, "audio_cache")
 
+# Stored episodes are committed once per feed, or every N inserts on long feeds
+COMMIT_EVERY = 16
+
+# Feeds are fetched and parsed concurrently; this bounds the open connections
+FEED_WORKERS = 16
+
+
+def _queue_episode(ep, transcripts, args, download_pool, transcribe_pool):
+    """Pick a transcript strategy for a new episode.
+
+    Returns an (episode, transcript, word_count, future) job: Podcast 2.0
+    transcripts are used as-is (future is None); otherwise the audio download
+    and transcription are queued on the worker pools and the future resolves
+    to (transcript, word_count, audio_path). Returns None if the episode has neither.
+    """
+    print(f"  [new] {ep.title}")
+
+    # Strategy 1: Check for Podcast 2.0 transcript
+    if ep.transcript_url:
+        print(f"  [podcast2.0] Found transcript URL")
+        transcript = transcripts.get(ep.transcript_url)
+        if transcript:
+            word_count = db.count_words(transcript)
+            print(f"  [podcast2.0] Got transcript ({word_count} words)")
+            return ep, transcript, word_count, None
+
+    # Strategy 2: Download and transcribe audio
+    if ep.audio_url:
+        # Worker output is tagged with the cache file name, not the episode
+        # title, and lands after later feeds' headers; this line maps the two
+        audio_file = os.path.basename(episode_cache_path(ep.audio_url, args.cache_dir))
+        print(f"  [queued] {audio_file}")
+        download = download_pool.submit(
+            download_audio, ep.audio_url, args.cache_dir,
+            pool_size=args.max_concurrent_downloads,
+            progress=False,
+        )
+        return ep, None, None, transcribe_pool.submit(_transcribe_download, download, args)
+
+    print(f"  [skip] No audio or transcript available")
+    return None
+
+
+def _transcribe_download(download, args):
+    """Wait for a queued audio download, then transcribe it."""
+    audio_path = download.result()
+    transcript, word_count = transcribe_audio_counted(
+        audio_path,
+        model_size=args.model_size,
+        cache_pcm=args.cache_pcm,
+        num_workers=args.max_concurrent_transcribe,
+    )
+    return transcript, word_count, audio_path
+
+
+def _finish_job(job):
+    """Wait for a queued episode to finish. Returns its db row, or None if it failed."""
+    ep, transcript, word_count, future = job
+    transcript_source = "podcast2.0"
+    audio_path = None
+
+    if future is not None:
+        try:
+            transcript, word_count, audio_path = future.result()
+        except Exception as e:
+            print(f"  [error] Transcription failed for {ep.title}: {e}")
+            return None
+        transcript_source = "whisper"
+
+    if not transcript:
+        print(f"  [skip] No transcript produced: {ep.title}")
+        return None
+
+    return {
+        "episode_id": ep.id,
+        "feed_name": ep.feed_name,
+        "feed_url": ep.feed_url,
+        "title": ep.title,
+        "published_at": ep.published_at,
+        "audio_url": ep.audio_url,
+        "audio_path": audio_path,
+        "transcript": transcript,
+        "transcript_source": transcript_source,
+        "word_count": word_count,
+    }
+
+
+def _store_jobs(conn, jobs) -> int:
+    """Store finished jobs in batches of COMMIT_EVERY. Returns the number stored."""
+    stored = 0
+    batch = []
+    for job in jobs:
+        row = _finish_job(job)
+        if row:
+            batch.append(row)
+        if len(batch) >= COMMIT_EVERY:
+            stored += db.store_episodes_batch(conn, batch)
+            for row in batch:
+                print(f"  [stored] {row['title']}")
+            batch = []
+    stored += db.store_episodes_batch(conn, batch)
+    for row in batch:
+        print(f"  [stored] {row['title']}")
+    return stored
+
+
+def _shutdown_pools(pools, cancel=False):
+    """Shut down executors; with cancel, pending work is dropped rather than run."""
+    for pool in pools:
+        pool.shutdown(cancel_futures=cancel)
+
 
 def cmd_scrape(args):
     """Fetch feeds, download audio, transcribe new episodes."""
@@ -40,75 +153,92 @@ def cmd_scrape(args):
     total_new = 0
     total_skipped = 0
 
-    for group_name, feed_list in groups_to_process.items():
-        print(f"\n=== Group: {group_name} ===")
+    # Kick off every feed fetch up front; results are consumed in config order
+    # below, so later feeds download while earlier ones are being processed.
+    # Fetches run on threads; the CPU-bound feedparser work runs on processes
+    # (spawned, since forking under live threads is unsafe).
+    feed_keys = list(dict.fromkeys(
+        (feed_config["name"], feed_config["feed_url"])
+        for feed_list in groups_to_process.values()
+        for feed_config in feed_list
+    ))
+    parser_pool = ProcessPoolExecutor(
+        max_workers=max(1, min(os.cpu_count() or 1, len(feed_keys))),
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+    pool = ThreadPoolExecutor(max_workers=FEED_WORKERS)
 
-        for feed_config in feed_list:
-            feed_name = feed_config["name"]
-            feed_url = feed_config["feed_url"]
+    # Audio downloads run ahead of transcription, so episode N+1 is fetched
+    # while episode N is still in whisper.
+    download_pool = ThreadPoolExecutor(max_workers=args.max_concurrent_downloads)
+    transcribe_pool = ThreadPoolExecutor(max_workers=args.max_concurrent_transcribe)
+    pools = (pool, parser_pool, download_pool, transcribe_pool)
 
-            print(f"\n--- {feed_name} ---")
-            print(f"  Feed: {feed_url}")
+    try:
+        parsed = {
+            key: pool.submit(
+                parse_feed, *key,
+                max_episodes=args.max_episodes,
+                parser_pool=parser_pool,
+            )
+            for key in feed_keys
+        }
+        pool.shutdown(wait=False)
+
+        # Pass 1: find new episodes in every feed and queue their transcription
+        feed_jobs = []
+        for group_name, feed_list in groups_to_process.items():
+            print(f"\n=== Group: {group_name} ===")
+
+            for feed_config in feed_list:
+                feed_name = feed_config["name"]
+                feed_url = feed_config["feed_url"]
+
+                print(f"\n--- {feed_name} ---")
+                print(f"  Feed: {feed_url}")
+
+                try:
+                    episodes = parsed[(feed_name, feed_url)].result()
+                except Exception as e:
+                    print(f"  [error] Failed to parse feed: {e}")
+                    continue
 
-            try:
-                episodes = parse_feed(feed_name, feed_url, max_episodes=args.max_episodes)
-            except Exception as e:
-                print(f"  [error] Failed to parse feed: {e}")
-                continue
+                print(f"  Found {len(episodes)} episode(s)")
 
-            print(f"  Found {len(episodes)} episode(s)")
+                existing = db.existing_ids(conn, [ep.id for ep in episodes])
+                new_episodes = []
+                for ep in episodes:
+                    # Skip if already transcribed
+                    if ep.id in existing:
+                        print(f"  [skip] Already stored: {ep.title}")
+                        total_skipped += 1
+                        continue
+                    new_episodes.append(ep)
 
-            for ep in episodes:
-                # Skip if already transcribed
-                if db.episode_exists(conn, ep.id):
-                    print(f"  [skip] Already stored: {ep.title}")
-                    total_skipped += 1
-                    continue
+                transcripts = fetch_transcripts(
+                    [ep.transcript_url for ep in new_episodes if ep.transcript_url]
+                )
 
-                print(f"  [new] {ep.title}")
-
-                transcript = None
-                transcript_source = None
-                audio_path = None
-
-                # Strategy 1: Check for Podcast 2.0 transcript
-                if ep.transcript_url:
-                    print(f"  [podcast2.0] Found transcript URL, downloading...")
-                    transcript = fetch_transcript(ep.transcript_url)
-                    if transcript:
-                        transcript_source = "podcast2.0"
-                        print(f"  [podcast2.0] Got transcript ({len(transcript.split())} words)")
-
-                # Strategy 2: Download and transcribe audio
-                if not transcript and ep.audio_url:
-                    try:
-                        audio_path = download_audio(ep.audio_url, args.cache_dir)
-                        transcript = transcribe_audio(audio_path, model_size=args.model_size)
-                        transcript_source = "whisper"
-                    except Exception as e:
-                        print(f"  [error] Transcription failed: {e}")
-                        continue
+                jobs = []
+                for ep in new_episodes:
+                    job = _queue_episode(ep, transcripts, args, download_pool, transcribe_pool)
+                    if job:
+                        jobs.append(job)
+                if jobs:
+                    feed_jobs.append((feed_name, jobs))
 
-                if not transcript:
-                    print(f"  [skip] No audio or transcript available")
-                    continue
+        # Pass 2: store results in feed order as they complete
+        for feed_name, jobs in feed_jobs:
+            print(f"\n--- {feed_name} ---")
 
-                # Store in database
-                db.store_episode(
-                    conn,
-                    episode_id=ep.id,
-                    feed_name=ep.feed_name,
-                    feed_url=ep.feed_url,
-                    title=ep.title,
-                    published_at=ep.published_at,
-                    audio_url=ep.audio_url,
-                    audio_path=audio_path,
-                    transcript=transcript,
-                    transcript_source=transcript_source,
-                )
-                total_new += 1
-                print(f"  [stored] {ep.title}")
+            total_new += _store_jobs(conn, jobs)
+    except BaseException:
+        # Drop queued downloads/transcriptions instead of running them out
+        _shutdown_pools(pools, cancel=True)
+        conn.close()
+        raise
 
+    _shutdown_pools(pools)
     conn.close()
 
     print(f"\n=== Done ===")
@@ -200,62 +330,46 @@ def cmd_adhoc(args):
     print(f"  Feed: {feed_url}")
 
     try:
-        episodes = parse_feed(feed_name, feed_url, max_episodes=args.max_episodes)
+        episodes = parse_feed(
+            feed_name, feed_url,
+            max_episodes=args.max_episodes,
+        )
     except Exception as e:
         print(f"  [error] Failed to parse feed: {e}")
         sys.exit(1)
 
     print(f"  Found {len(episodes)} episode(s)")
 
-    new_count = 0
+    existing = db.existing_ids(conn, [ep.id for ep in episodes])
+    new_episodes = []
     for ep in episodes:
-        if db.episode_exists(conn, ep.id):
+        if ep.id in existing:
             print(f"  [skip] Already stored: {ep.title}")
             continue
+        new_episodes.append(ep)
 
-        print(f"  [new] {ep.title}")
-
-        transcript = None
-        transcript_source = None
-        audio_path = None
-
-        # Strategy 1: Podcast 2.0 transcript
-        if ep.transcript_url:
-            print(f"  [podcast2.0] Found transcript URL, downloading...")
-            transcript = fetch_transcript(ep.transcript_url)
-            if transcript:
-                transcript_source = "podcast2.0"
-                print(f"  [podcast2.0] Got transcript ({len(transcript.split())} words)")
-
-        # Strategy 2: Download and transcribe audio
-        if not transcript and ep.audio_url:
-            try:
-                audio_path = download_audio(ep.audio_url, args.cache_dir)
-                transcript = transcribe_audio(audio_path, model_size=args.model_size)
-                transcript_source = "whisper"
-            except Exception as e:
-                print(f"  [error] Transcription failed: {e}")
-                continue
-
-        if not transcript:
-            print(f"  [skip] No audio or transcript available")
-            continue
+    transcripts = fetch_transcripts(
+        [ep.transcript_url for ep in new_episodes if ep.transcript_url]
+    )
 
-        db.store_episode(
-            conn,
-            episode_id=ep.id,
-            feed_name=ep.feed_name,
-            feed_url=ep.feed_url,
-            title=ep.title,
-            published_at=ep.published_at,
-            audio_url=ep.audio_url,
-            audio_path=audio_path,
-            transcript=transcript,
-            transcript_source=transcript_source,
-        )
-        new_count += 1
-        print(f"  [stored] {ep.title}")
+    download_pool = ThreadPoolExecutor(max_workers=args.max_concurrent_downloads)
+    transcribe_pool = ThreadPoolExecutor(max_workers=args.max_concurrent_transcribe)
+    pools = (download_pool, transcribe_pool)
 
+    try:
+        jobs = []
+        for ep in new_episodes:
+            job = _queue_episode(ep, transcripts, args, download_pool, transcribe_pool)
+            if job:
+                jobs.append(job)
+
+        new_count = _store_jobs(conn, jobs)
+    except BaseException:
+        _shutdown_pools(pools, cancel=True)
+        conn.close()
+        raise
+
+    _shutdown_pools(pools)
     conn.close()
 
     if new_count == 0:
@@ -332,7 +446,10 @@ def main():
     p_scrape.add_argument("-n", "--max-episodes", type=int, default=10, help="Max episodes to check per feed (default: 10, dedup skips already-stored)")
     p_scrape.add_argument("--db", default=DEFAULT_DB, help="SQLite database path")
     p_scrape.add_argument("--cache-dir", default=DEFAULT_CACHE, help="Audio cache directory")
-    p_scrape.add_argument("--model-size", default="base", help="Whisper model size (tiny/base/small/medium/large-v3)")
+    p_scrape.add_argument("--model-size", default="base", help="Whisper model size (tiny/base/small/medium/large-v3/distil-large-v3/large-v3-turbo)")
+    p_scrape.add_argument("--max-concurrent-transcribe", type=int, default=2, help="Episodes transcribed in parallel through one shared model (default: 2)")
+    p_scrape.add_argument("--max-concurrent-downloads", type=int, default=4, help="Audio downloads in parallel (default: 4)")
+    p_scrape.add_argument("--cache-pcm", action="store_true", help="Cache decoded audio next to the download so re-transcribing skips decoding (~230 MB/hour)")
 
     # --- adhoc ---
     p_adhoc = subparsers.add_parser("adhoc", help="Scrape a one-off RSS feed URL, transcribe, and digest")
@@ -343,7 +460,10 @@ def main():
     p_adhoc.add_argument("--digest-dir", help="Digest output dir (default: /tmp/podcasts_adhoc_digest)")
     p_adhoc.add_argument("--db", default=DEFAULT_DB, help="SQLite database path")
     p_adhoc.add_argument("--cache-dir", default=DEFAULT_CACHE, help="Audio cache directory")
-    p_adhoc.add_argument("--model-size", default="base", help="Whisper model size (tiny/base/small/medium/large-v3)")
+    p_adhoc.add_argument("--model-size", default="base", help="Whisper model size (tiny/base/small/medium/large-v3/distil-large-v3/large-v3-turbo)")
+    p_adhoc.add_argument("--max-concurrent-transcribe", type=int, default=2, help="Episodes transcribed in parallel through one shared model (default: 2)")
+    p_adhoc.add_argument("--max-concurrent-downloads", type=int, default=4, help="Audio downloads in parallel (default: 4)")
+    p_adhoc.add_argument("--cache-pcm", action="store_true", help="Cache decoded audio next to the download so re-transcribing skips decoding (~230 MB/hour)")
 
     # --- export ---
     p_export = subparsers.add_parser("export", help="Export recent transcripts to text file")
@@ -3,6 +3,8 @@
 import os
 import re
 from collections import defaultdict
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from typing import Optional
 
 from . import db
@@ -10,7 +12,14 @@ from . import db
 
 DELIMITER = "---"
 
+# Write buffer for text exports (fewer write syscalls on multi-MB exports)
+EXPORT_BUFFER_SIZE = 1 << 20
 
+_RE_HWS = re.compile(r"[ \t]+")
+_RE_NL = re.compile(r"\n{3,}")
+
+
+@lru_cache(maxsize=4096)
 def _format_date(published_at: Optional[str]) -> str:
     """Extract a short date from the published_at string."""
     if not published_at:
@@ -21,7 +30,6 @@ def _format_date(published_at: Optional[str]) -> str:
         return published_at[:10]
     # For RFC 2822 like "Mon, 10 Feb 2026 08:00:00 +0000", extract date parts
     try:
-        from email.utils import parsedate_to_datetime
         dt = parsedate_to_datetime(published_at)
         return dt.strftime("%Y-%m-%d")
     except Exception:
@@ -64,30 +72,35 @@ def export_transcripts(
 
     os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
 
-    blocks = []
+    episode_count = 0
     total_words = 0
+    separator = f"\n{DELIMITER}\n"
+
+    # Stream blocks straight to the file so transcripts aren't held twice
+    # (once per block, once in a joined string) for large lookback windows.
+    with open(output_path, "w", buffering=EXPORT_BUFFER_SIZE) as f:
+        for ep in episodes:
+            transcript = ep["transcript"]
+            if not transcript:
+                continue
+
+            header = f"[{ep['feed_name']}]: {ep['title']} ({_format_date(ep['published_at'])})"
+            if episode_count:
+                f.write(separator)
+            # Written separately so the transcript is never copied into a
+            # header+transcript string
+            f.write(f"{header}\n")
+            f.write(transcript)
+            episode_count += 1
+            total_words += ep["word_count"] or 0
 
-    for ep in episodes:
-        transcript = ep.get("transcript", "")
-        if not transcript:
-            continue
-
-        date_str = _format_date(ep.get("published_at"))
-        header = f"[{ep['feed_name']}]: {ep['title']} ({date_str})"
-        blocks.append(f"{header}\n{transcript}")
-        total_words += ep.get("word_count", 0)
-
-    content = f"\n{DELIMITER}\n".join(blocks)
-
-    with open(output_path, "w") as f:
-        f.write(content)
         f.write("\n")
 
-    print(f"Exported {len(blocks)} episode(s) to {output_path}")
+    print(f"Exported {episode_count} episode(s) to {output_path}")
     print(f"Total words: {total_words:,}")
 
     return {
-        "episode_count": len(blocks),
+        "episode_count": episode_count,
         "output_path": output_path,
         "total_words": total_words,
     }
@@ -96,8 +109,8 @@ def export_transcripts(
 def _normalize_excerpt_text(text: str) -> str:
     # Keep paragraphs, but collapse very noisy whitespace.
     t = text.replace("\r\n", "\n").replace("\r", "\n")
-    t = re.sub(r"[ \t]+", " ", t)
-    t = re.sub(r"\n{3,}", "\n\n", t)
+    t = _RE_HWS.sub(" ", t)
+    t = _RE_NL.sub("\n\n", t)
     return t.strip()
 
 
@@ -140,40 +153,39 @@ def export_transcripts_json(
     """
     conn = db.connect(db_path)
 
-    if group_feeds:
-        episodes = db.fetch_by_group(conn, group_feeds, lookback_hours)
-    else:
-        episodes = db.fetch_recent(conn, lookback_hours)
-
-    conn.close()
+    # Apply the caps on metadata alone, then load only the transcripts we keep
+    episodes = db.fetch_recent_meta(conn, lookback_hours, group_feeds or None)
 
-    selected = []
+    chosen = []
     per_feed_counts = defaultdict(int)
 
     for ep in episodes:
-        if len(selected) >= max_episodes_total:
+        if len(chosen) >= max_episodes_total:
             break
 
-        transcript = ep.get("transcript") or ""
-        if not transcript.strip():
-            continue
-
         feed_name = ep.get("feed_name") or ""
         if max_episodes_per_feed > 0 and per_feed_counts[feed_name] >= max_episodes_per_feed:
             continue
 
+        chosen.append(ep)
+        per_feed_counts[feed_name] += 1
+
+    transcripts = db.fetch_transcripts_by_id(conn, [ep["id"] for ep in chosen])
+    conn.close()
+
+    selected = []
+    for ep in chosen:
         selected.append(
             {
                 "episodeId": ep.get("id"),
-                "feedName": feed_name,
+                "feedName": ep.get("feed_name") or "",
                 "title": ep.get("title") or "",
                 "publishedAt": ep.get("published_at"),
                 "scrapedAt": ep.get("scraped_at"),
                 "wordCount": ep.get("word_count") or 0,
-                "transcriptExcerpt": _excerpt_transcript(transcript, excerpt_chars),
+                "transcriptExcerpt": _excerpt_transcript(transcripts.get(ep["id"], ""), excerpt_chars),
             }
         )
-        per_feed_counts[feed_name] += 1
 
     return {
         "episodeCount": len(selected),
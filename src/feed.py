@@ -1,7 +1,9 @@
 """RSS feed parsing — fetch episodes from podcast feeds."""
 
+import heapq
 import json
 import hashlib
+from concurrent.futures import Executor, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from time import mktime
 from typing import Optional
@@ -9,6 +11,12 @@ from typing import Optional
 import feedparser
 import requests
 
+from .http_session import make_session
+
+
+# Shared across feed and transcript fetches so repeat hosts reuse connections
+_SESSION = make_session()
+
 
 @dataclass
 class Episode:
@@ -74,7 +82,9 @@ def _get_episode_id(entry, feed_url: str) -> str:
     guid = entry.get("id") or entry.get("guid")
     if guid:
         return guid
-    # Fallback: hash of feed URL + title
+    # Fallback: hash of feed URL + title. This is a persisted primary key, so
+    # the hash must stay SHA-256 — changing it would re-transcribe every
+    # guid-less episode already stored.
     title = entry.get("title", "unknown")
     return hashlib.sha256(f"{feed_url}:{title}".encode()).hexdigest()[:32]
 
@@ -82,25 +92,76 @@ def _get_episode_id(entry, feed_url: str) -> str:
 def fetch_transcript(url: str) -> Optional[str]:
     """Download a Podcast 2.0 transcript from a URL."""
     try:
-        resp = requests.get(url, timeout=30)
+        resp = _SESSION.get(url, timeout=30)
         resp.raise_for_status()
-        return resp.text
-    except requests.RequestException:
+        # Decode directly rather than via resp.text, which falls back to
+        # charset sniffing over the whole body. VTT is UTF-8 by spec and SRT /
+        # JSON transcripts nearly always are, so only an explicit charset wins.
+        content_type = resp.headers.get("content-type", "").lower()
+        encoding = resp.encoding if "charset=" in content_type else "utf-8"
+        return resp.content.decode(encoding, errors="replace")
+    except (requests.RequestException, LookupError):
         return None
 
 
-def parse_feed(feed_name: str, feed_url: str, max_episodes: int = 1) -> list[Episode]:
-    """Parse an RSS feed and return the latest episodes."""
-    feed = feedparser.parse(feed_url)
+def fetch_transcripts(urls: list[str], max_workers: int = 8) -> dict[str, Optional[str]]:
+    """Download several Podcast 2.0 transcripts concurrently, keyed by URL."""
+    unique_urls = list(dict.fromkeys(urls))
+    if not unique_urls:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_urls))) as pool:
+        return dict(zip(unique_urls, pool.map(fetch_transcript, unique_urls)))
+
+
+def _fetch_feed_body(feed_url: str) -> tuple[bytes, dict[str, str]]:
+    """Download the raw RSS document. Returns (body, lowercased response headers)."""
+    resp = _SESSION.get(feed_url, timeout=30, headers={"User-Agent": feedparser.USER_AGENT})
+    resp.raise_for_status()
+    headers = {k.lower(): v for k, v in resp.headers.items()}
+    # feedparser only knows the document's URL when it fetches it itself; this
+    # is the base it resolves relative enclosure and transcript links against
+    headers["content-location"] = resp.url
+    return resp.content, headers
+
+
+def parse_feed(
+    feed_name: str,
+    feed_url: str,
+    max_episodes: int = 1,
+    parser_pool: Optional[Executor] = None,
+) -> list[Episode]:
+    """Fetch an RSS feed and return the latest episodes.
+
+    Safe to call from worker threads, so callers can overlap the network
+    fetches for many feeds. feedparser is pure Python, so passing a
+    ProcessPoolExecutor as parser_pool moves the parse itself off the GIL.
+    """
+    body, headers = _fetch_feed_body(feed_url)
+    if parser_pool is not None:
+        return parser_pool.submit(
+            parse_feed_body, feed_name, feed_url, body, headers, max_episodes
+        ).result()
+    return parse_feed_body(feed_name, feed_url, body, headers, max_episodes)
+
+
+def parse_feed_body(
+    feed_name: str,
+    feed_url: str,
+    body: bytes,
+    headers: Optional[dict[str, str]] = None,
+    max_episodes: int = 1,
+) -> list[Episode]:
+    """Parse an already-downloaded RSS document and return the latest episodes."""
+    feed = feedparser.parse(body, response_headers=headers)
 
     if feed.bozo and not feed.entries:
         raise ValueError(f"Failed to parse feed: {feed_url} — {feed.bozo_exception}")
 
-    # Sort entries by date, newest first
-    sorted_entries = sorted(feed.entries, key=_get_entry_timestamp, reverse=True)
+    # Newest max_episodes entries, newest first (same order as a full reverse sort)
+    latest_entries = heapq.nlargest(max_episodes, feed.entries, key=_get_entry_timestamp)
 
     episodes = []
-    for entry in sorted_entries[:max_episodes]:
+    for entry in latest_entries:
         episode = Episode(
             id=_get_episode_id(entry, feed_url),
             feed_name=feed_name,
@@ -0,0 +1,23 @@
+"""Shared HTTP session factory for feed, transcript and audio fetches."""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def make_session(pool_size: int = 32) -> requests.Session:
+    """Build a keep-alive session with pooled connections and retry/backoff.
+
+    pool_size bounds both the hosts kept in the pool and the idle connections
+    kept per host; size it to the number of concurrent requests. Retries cover
+    getting a response, not a body that fails partway through.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(total=3, backoff_factor=0.5),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
@@ -0,0 +1,203 @@
+"""download_audio against a fake HTTP session: full, resumed, restarted and retried fetches."""
+
+import os
+
+import pytest
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from src import transcribe
+
+
+URL = "https://cdn.example.com/show/episode.mp3"
+BODY = bytes(range(256)) * 64
+ETAG = '"v1"'
+
+
+class FakeResponse:
+    def __init__(self, status_code, body=b"", headers=None, drop_after=None):
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers or {})
+        self._body = body
+        self._drop_after = drop_after
+        self.closed = False
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error")
+
+    def iter_content(self, chunk_size=1):
+        for i in range(0, len(self._body), 1024):
+            if self._drop_after is not None and i >= self._drop_after:
+                raise requests.exceptions.ChunkedEncodingError("connection reset")
+            yield self._body[i:i + 1024]
+
+    def close(self):
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class FakeServer:
+    """Serves one body with an ETag, honouring Range and If-Range like a CDN."""
+
+    def __init__(self, body=BODY, etag=ETAG, drop_first_after=None, ignore_if_range=False):
+        self.body = body
+        self.etag = etag
+        self.drop_first_after = drop_first_after
+        self.ignore_if_range = ignore_if_range
+        self.requests = []
+        self.responses = []
+
+    def get(self, url, stream=False, timeout=None, headers=None):
+        headers = headers or {}
+        self.requests.append(dict(headers))
+        response = self._respond(headers)
+        self.responses.append(response)
+        return response
+
+    def _respond(self, headers):
+        drop_after = self.drop_first_after if len(self.requests) == 1 else None
+        base = {"ETag": self.etag} if self.etag else {}
+
+        range_header = headers.get("Range")
+        if_range = headers.get("If-Range")
+        if range_header and (self.ignore_if_range or if_range == self.etag):
+            start = int(range_header[len("bytes="):-1])
+            if start >= len(self.body):
+                return FakeResponse(416, headers=base)
+            rest = self.body[start:]
+            return FakeResponse(206, rest, {
+                **base,
+                "Content-Length": str(len(rest)),
+                "Content-Range": f"bytes {start}-{len(self.body) - 1}/{len(self.body)}",
+            }, drop_after)
+        return FakeResponse(200, self.body, {
+            **base, "Content-Length": str(len(self.body)),
+        }, drop_after)
+
+
+@pytest.fixture
+def server(monkeypatch):
+    def install(**kwargs):
+        fake = FakeServer(**kwargs)
+        monkeypatch.setattr(transcribe, "_download_session", lambda pool_size: fake)
+        return fake
+    monkeypatch.setattr(transcribe, "DOWNLOAD_RETRY_BACKOFF", 0)
+    return install
+
+
+def _leave_partial(cache_dir, data, validator=ETAG, total=len(BODY)):
+    partial_path = transcribe.episode_cache_path(URL, str(cache_dir)) + ".partial"
+    os.makedirs(cache_dir, exist_ok=True)
+    with open(partial_path, "wb") as f:
+        f.write(data)
+    if validator is not None:
+        with open(partial_path + transcribe.PARTIAL_META_SUFFIX, "w") as f:
+            f.write(f"{validator}\n{total}")
+    return partial_path
+
+
+def _read(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def test_full_download(server, tmp_path):
+    fake = server()
+    path = transcribe.download_audio(URL, str(tmp_path))
+
+    assert _read(path) == BODY
+    assert fake.requests == [{}]
+    assert sorted(os.listdir(tmp_path)) == [os.path.basename(path)]
+
+
+def test_resumes_partial_with_if_range(server, tmp_path):
+    fake = server()
+    _leave_partial(tmp_path, BODY[:5000])
+    path = transcribe.download_audio(URL, str(tmp_path))
+
+    assert _read(path) == BODY
+    assert fake.requests == [{"Range": "bytes=5000-", "If-Range": ETAG}]
+
+
+def test_changed_body_restarts_instead_of_splicing(server, tmp_path):
+    new_body = b"ad-inserted" + BODY
+    fake = server(body=new_body, etag='"v2"')
+    _leave_partial(tmp_path, BODY[:5000])
+    path = transcribe.download_audio(URL, str(tmp_path))
+
+    assert _read(path) == new_body
+    assert len(fake.requests) == 1
+
+
+def test_mismatched_content_range_restarts(server, tmp_path):
+    # A server that ignores If-Range answers 206 for a body of another length
+    new_body = BODY + b"trailing ad"
+    fake = server(body=new_body, ignore_if_range=True)
+    _leave_partial(tmp_path, BODY[:5000])
+    path = transcribe.download_audio(URL, str(tmp_path))
+
+    assert _read(path) == new_body
+    assert fake.requests[-1] == {}
+
+
+def test_416_restarts(server, tmp_path):
+    fake = server()
+    _leave_partial(tmp_path, BODY + b"extra")
+    path = transcribe.download_audio(URL, str(tmp_path))
+
+    assert _read(path) == BODY
+    assert [r.get("Range") for r in fake.requests] == [f"bytes={len(BODY) + 5}-", None]
+    assert all(response.closed for response in fake.responses)
+
+
+def test_partial_without_validator_is_not_resumed(server, tmp_path):
+    fake = server()
+    _leave_partial(tmp_path, BODY[:5000], validator=None)
+    path = transcribe.download_audio(URL, str(tmp_path))
+
+    assert _read(path) == BODY
+    assert fake.requests == [{}]
+
+
+def test_mid_body_drop_resumes(server, tmp_path):
+    fake = server(drop_first_after=4096)
+    path = transcribe.download_audio(URL, str(tmp_path))
+
+    assert _read(path) == BODY
+    assert fake.requests == [{}, {"Range": "bytes=4096-", "If-Range": ETAG}]
+
+
+def test_repeated_drops_give_up(server, tmp_path, monkeypatch):
+    monkeypatch.setattr(transcribe, "DOWNLOAD_ATTEMPTS", 1)
+    fake = server(drop_first_after=4096)
+
+    with pytest.raises(requests.exceptions.ChunkedEncodingError):
+        transcribe.download_audio(URL, str(tmp_path))
+    assert fake.responses[0].closed
+
+
+def test_deleted_cache_file_is_downloaded_again(server, tmp_path):
+    fake = server()
+    path = transcribe.download_audio(URL, str(tmp_path))
+    os.remove(path)
+    path = transcribe.download_audio(URL, str(tmp_path))
+
+    assert _read(path) == BODY
+    assert fake.requests == [{}, {}]
+
+
+def test_file_saved_after_listing_is_a_cache_hit(server, tmp_path):
+    fake = server()
+    transcribe._cache_listing(str(tmp_path))
+    with open(transcribe.episode_cache_path(URL, str(tmp_path)), "wb") as f:
+        f.write(BODY)
+    path = transcribe.download_audio(URL, str(tmp_path))
+
+    assert _read(path) == BODY
+    assert fake.requests == []